@@ -1,14 +1,16 @@
 # app/agent_loop.py
 from __future__ import annotations
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from .budget import compare_to_budget
 
-def propose_actions() -> List[str]:
+def propose_actions(cmp: Optional[Dict[str, Tuple[float, float, float]]] = None) -> List[str]:
     """
     Simple rule-based 'agent' that reads this month's (budget, actual, delta)
     and proposes actions. Positive delta = over budget.
+    Pass `cmp` (from compare_to_budget) to reason about another month.
     """
-    cmp = compare_to_budget()
+    if cmp is None:
+        cmp = compare_to_budget()
     actions: List[str] = []
 
     for cat, (budget, actual, delta) in sorted(cmp.items(), key=lambda kv: kv[1][2], reverse=True):
@@ -1,6 +1,6 @@
 # app/budget.py
 from __future__ import annotations
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 from sqlalchemy import text
 from datetime import datetime
 
@@ -16,6 +16,22 @@ def _current_month() -> str:
     return datetime.now().strftime("%Y-%m")
 
 
+def next_month(month: str) -> str:
+    """YYYY-MM of the month after `month`."""
+    y, m = map(int, month.split("-"))
+    return f"{y + 1:04d}-01" if m == 12 else f"{y:04d}-{m + 1:02d}"
+
+
+def month_range(start: str, end: str) -> List[str]:
+    """Inclusive list of YYYY-MM months from start to end."""
+    if start > end:
+        raise ValueError(f"start month {start} is after end month {end}")
+    months = [start]
+    while months[-1] != end:
+        months.append(next_month(months[-1]))
+    return months
+
+
 # ------------------------------------------------------------------------------
 # Generate and save budgets
 # ------------------------------------------------------------------------------
@@ -60,27 +76,52 @@ def save_budgets(budgets: Dict[str, float]) -> None:
 # Month-to-date comparison
 # ------------------------------------------------------------------------------
 
-def compare_to_budget(month: str | None = None) -> Dict[str, Tuple[float, float, float]]:
+_RANGE_SPEND_SQL = text("""
+  SELECT substr(date, 1, 7) as month, COALESCE(category,'Other') as cat,
+         SUM(amount) as spend, COUNT(*) as txns
+  FROM transactions
+  WHERE pending = 0
+    AND date >= :start
+    AND date < :end
+    AND amount > 0
+  GROUP BY month, cat
+""")
+
+
+def range_spend(session, start: str, end: str) -> Dict[str, Dict[str, Tuple[float, int]]]:
     """
-    Compare actual spend (month-to-date) vs saved budgets for given month.
-    Returns {category: (budget, actual, delta)}.
+    Single aggregate scan of settled spend for months start..end (inclusive).
+    Uses a plain date range so an index on `date` applies.
+    Returns {month: {category: (spend, txn_count)}}.
     """
-    if month is None:
-        month = _current_month()
+    params = {"start": f"{start}-01", "end": f"{next_month(end)}-01"}
+    out: Dict[str, Dict[str, Tuple[float, int]]] = {}
+    for month, cat, spend, txns in session.execute(_RANGE_SPEND_SQL, params).all():
+        out.setdefault(month, {})[cat] = (float(spend or 0.0), int(txns or 0))
+    return out
 
-    sql = text("""
-      SELECT COALESCE(category,'Other') as cat, SUM(amount) as spend
-      FROM transactions
-      WHERE pending = 0
-        AND strftime('%Y-%m', date) = :month
-        AND amount > 0
-      GROUP BY cat
-    """)
-    with SessionLocal() as s:
-        actuals = dict(s.execute(sql, {"month": month}).all())
-        budgets = {b.category or "Other": float(b.amount)
-                   for b in s.query(Budget).filter(Budget.month == month).all()}
 
+def range_budgets(session, start: str, end: str) -> Dict[str, Dict[str, float]]:
+    """Saved budgets for months start..end (inclusive) as {month: {category: amount}}."""
+    out: Dict[str, Dict[str, float]] = {}
+    for b in session.query(Budget).filter(Budget.month >= start, Budget.month <= end).all():
+        out.setdefault(b.month, {})[b.category or "Other"] = float(b.amount)
+    return out
+
+
+def month_spend(session, month: str) -> Dict[str, Tuple[float, int]]:
+    """One month's settled spend as {category: (spend, txn_count)}."""
+    return range_spend(session, month, month).get(month, {})
+
+
+def month_budgets(session, month: str) -> Dict[str, float]:
+    """Saved budgets for a month as {category: amount}."""
+    return range_budgets(session, month, month).get(month, {})
+
+
+def combine_budget_actuals(budgets: Dict[str, float],
+                           actuals: Dict[str, float]) -> Dict[str, Tuple[float, float, float]]:
+    """Merge budgets and actuals into {category: (budget, actual, delta)}."""
     out: Dict[str, Tuple[float, float, float]] = {}
     for cat in set(budgets) | set(actuals):
         b = budgets.get(cat, 0.0)
@@ -90,6 +131,23 @@ def compare_to_budget(month: str | None = None) -> Dict[str, Tuple[float, float,
     return out
 
 
+def compare_to_budget(month: str | None = None, session=None) -> Dict[str, Tuple[float, float, float]]:
+    """
+    Compare actual spend (month-to-date) vs saved budgets for given month.
+    Returns {category: (budget, actual, delta)}.
+    Pass `session` to reuse an existing (e.g. read-only) session.
+    """
+    if month is None:
+        month = _current_month()
+
+    if session is None:
+        with SessionLocal() as s:
+            return compare_to_budget(month, session=s)
+
+    actuals = {cat: spend for cat, (spend, _) in month_spend(session, month).items()}
+    return combine_budget_actuals(month_budgets(session, month), actuals)
+
+
 # ------------------------------------------------------------------------------
 # Timeframe-window comparison (scaled budgets)
 # ------------------------------------------------------------------------------
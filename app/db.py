@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 from .config import settings
 
@@ -9,3 +10,17 @@ Base = declarative_base()
 def init_db():
     from . import models  # noqa: F401
     Base.metadata.create_all(bind=engine)
+
+def readonly_engine(database_url: str):
+    """
+    Engine for reporting. Read-only is enforced for SQLite files (mode=ro) and
+    PostgreSQL (read-only transactions); other backends get a plain engine.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "sqlite" and url.database not in (None, "", ":memory:"):
+        url = url.set(database=f"file:{url.database}").update_query_dict({"mode": "ro", "uri": "true"})
+    elif backend == "postgresql":
+        return create_engine(url, future=True, echo=False,
+                             execution_options={"postgresql_readonly": True})
+    return create_engine(url, future=True, echo=False)
@@ -0,0 +1,136 @@
+# app/report.py
+from __future__ import annotations
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, TextIO
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import ArgumentError
+from sqlalchemy.orm import Session
+
+from .db import readonly_engine
+from .budget import range_spend, range_budgets, combine_budget_actuals
+from .agent_loop import propose_actions
+
+# ------------------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------------------
+
+# One read-only engine per database, per worker process.
+_ENGINES: Dict[str, object] = {}
+
+
+def _engine_for(database_url: str):
+    if database_url not in _ENGINES:
+        _ENGINES[database_url] = readonly_engine(database_url)
+    return _ENGINES[database_url]
+
+
+def db_label(database_url: str) -> str:
+    """
+    Report-safe name for a database: the SQLite path, or the URL without its password.
+    Unparseable URLs are returned as given so their error entry can still be labelled.
+    """
+    try:
+        url = make_url(database_url)
+    except ArgumentError:
+        return database_url
+    if url.get_backend_name() == "sqlite" and url.database:
+        return url.database
+    return url.render_as_string(hide_password=True)
+
+
+# ------------------------------------------------------------------------------
+# Per-database report
+# ------------------------------------------------------------------------------
+
+def _month_report(label: str, month: str,
+                  spend: Dict[str, tuple], budgets: Dict[str, float]) -> dict:
+    """Budget-vs-actual, spend summary and proposals for one month."""
+    cmp = combine_budget_actuals(budgets, {cat: amt for cat, (amt, _) in spend.items()})
+    categories = [
+        {
+            "category": cat,
+            "budget": round(b, 2),
+            "actual": round(a, 2),
+            "delta": round(d, 2),
+            "txns": spend.get(cat, (0.0, 0))[1],
+        }
+        for cat, (b, a, d) in sorted(cmp.items(), key=lambda kv: kv[0].lower())
+    ]
+    return {
+        "database": label,
+        "month": month,
+        "total_budget": round(sum(budgets.values()), 2),
+        "total_spend": round(sum(amt for amt, _ in spend.values()), 2),
+        "txns": sum(n for _, n in spend.values()),
+        "categories": categories,
+        "proposals": propose_actions(cmp),
+    }
+
+
+def database_report(database_url: str, months: List[str]) -> List[dict]:
+    """
+    Month reports for one database over consecutive `months`.
+    Uses one aggregate spend scan and one budget lookup for the whole range.
+    """
+    start, end = months[0], months[-1]
+    with Session(_engine_for(database_url)) as s:
+        spend = range_spend(s, start, end)
+        budgets = range_budgets(s, start, end)
+
+    label = db_label(database_url)
+    return [_month_report(label, m, spend.get(m, {}), budgets.get(m, {})) for m in months]
+
+
+def _database_report_task(task) -> List[dict]:
+    """Run database_report, turning a failure into an error entry instead of aborting the batch."""
+    database_url, months = task
+    try:
+        return database_report(database_url, months)
+    except Exception as exc:
+        return [{"database": db_label(database_url), "error": str(exc)}]
+
+
+def batch_report(database_urls: Iterable[str], months: List[str],
+                 workers: Optional[int] = None) -> List[dict]:
+    """
+    Run database_report for every database, one process-pool task per database.
+    Failed databases appear as {"database", "error"} entries.
+    """
+    tasks = [(url, months) for url in database_urls]
+    if not tasks or not months:
+        return []
+    if workers == 1 or len(tasks) == 1:
+        results = [_database_report_task(t) for t in tasks]
+    else:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(_database_report_task, tasks))
+    return [r for reports in results for r in reports]
+
+
+# ------------------------------------------------------------------------------
+# Output
+# ------------------------------------------------------------------------------
+
+CSV_FIELDS = ["database", "month", "category", "budget", "actual", "delta", "txns"]
+
+
+def write_json(reports: List[dict], out: TextIO) -> None:
+    json.dump(reports, out, indent=2)
+    out.write("\n")
+
+
+def write_csv(reports: List[dict], out: TextIO) -> None:
+    """One row per (database, month, category). Proposals and errors are JSON-only."""
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for r in reports:
+        if "error" in r:
+            continue
+        for row in r["categories"]:
+            writer.writerow({"database": r["database"], "month": r["month"], **row})
@@ -1,12 +1,18 @@
 import argparse
+import sys
+from datetime import datetime
 from tabulate import tabulate
-from app.budget import spend_by_category, generate_budgets, save_budgets, compare_to_budget
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import ArgumentError
+from app.budget import month_range, spend_by_category_window, generate_budgets, save_budgets, compare_to_budget
+from app.config import settings
 from app.db import init_db
 from app.agent_loop import propose_actions
+from app.report import batch_report, write_json, write_csv
 
 def cmd_spend(args):
-    s = spend_by_category(days=args.days)
-    rows = [(k, round(v, 2)) for k, v in s.by_category.items()]
+    s = spend_by_category_window(days=args.days)
+    rows = [(k, round(v, 2)) for k, v in s.items()]
     print(tabulate(rows, headers=["Category", f"Spend ({args.days}d)"]))
 
 def cmd_budget(args):
@@ -24,8 +30,45 @@ def cmd_propose(args):
     for i, action in enumerate(propose_actions(), 1):
         print(f"{i}. {action}")
 
+def _month_arg(value):
+    try:
+        return datetime.strptime(value, "%Y-%m").strftime("%Y-%m")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid month {value!r}, expected YYYY-MM")
+
+def _db_arg(value):
+    try:
+        make_url(value)
+    except ArgumentError:
+        raise argparse.ArgumentTypeError(f"invalid database URL {value!r}")
+    return value
+
+def _positive_int(value):
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"invalid count {value!r}, expected a positive integer")
+    return n
+
+def cmd_report(args):
+    months = month_range(args.start, args.end)
+    reports = batch_report(args.db or [settings.database_url], months, workers=args.workers)
+    failed = [r for r in reports if "error" in r]
+    write = write_csv if args.format == "csv" else write_json
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            write(reports, f)
+        print(f"Wrote {len(reports) - len(failed)} month reports to {args.out}")
+    else:
+        write(reports, sys.stdout)
+    for r in failed:
+        print(f"report failed for {r['database']}: {r['error']}", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
 if __name__ == "__main__":
-    init_db()
     p = argparse.ArgumentParser(prog="plaid-budget-agent")
     sub = p.add_subparsers(required=True)
 
@@ -39,5 +82,20 @@ if __name__ == "__main__":
     st = sub.add_parser("status"); st.set_defaults(func=cmd_status)
     pr = sub.add_parser("propose"); pr.set_defaults(func=cmd_propose)
 
+    this_month = datetime.now().strftime("%Y-%m")
+    rp = sub.add_parser("report", help="Batch budget/spend/proposal report over a month range")
+    rp.set_defaults(func=cmd_report)
+    rp.add_argument("--start", type=_month_arg, default=this_month, help="First month (YYYY-MM)")
+    rp.add_argument("--end", type=_month_arg, default=this_month, help="Last month (YYYY-MM), inclusive")
+    rp.add_argument("--db", type=_db_arg, action="append", help="Database URL per user; repeatable (default: DATABASE_URL)")
+    rp.add_argument("--workers", type=_positive_int, default=None, help="Process pool size (default: CPU count)")
+    rp.add_argument("--format", choices=["json", "csv"], default="json")
+    rp.add_argument("--out", help="Output file (default: stdout)")
+
     args = p.parse_args()
+    if args.func is cmd_report:  # skip init_db for report: it only reads
+        if args.start > args.end:
+            p.error(f"--start {args.start} is after --end {args.end}")
+    else:
+        init_db()
     args.func(args)
@@ -0,0 +1,99 @@
+import csv
+import io
+import json
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.budget import month_range
+from app.db import Base, readonly_engine
+from app.models import Budget, Transaction
+from app.report import batch_report, write_csv, write_json
+
+
+def _seed(path, txns, budgets):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as s:
+        for i, (date, cat, amount) in enumerate(txns):
+            s.add(Transaction(plaid_txn_id=f"t{i}", account_id="acc", amount=amount,
+                              date=date, category=cat, pending=False))
+        for month, cat, amount in budgets:
+            s.add(Budget(month=month, category=cat, amount=amount))
+        s.commit()
+    engine.dispose()
+    return f"sqlite:///{path}"
+
+
+@pytest.fixture
+def user_dbs(tmp_path):
+    txns = [
+        ("2025-11-30", "Food", 999.0),   # before range
+        ("2025-12-01", "Food", 40.0),
+        ("2025-12-31", "Food", 60.0),
+        ("2026-01-15", None, 25.0),
+        ("2026-01-20", "Food", -500.0),  # income, not spend
+        ("2026-02-01", "Food", 999.0),   # after range
+    ]
+    budgets = [("2025-12", "Food", 80.0), ("2026-01", "Travel", 200.0)]
+    a = _seed(tmp_path / "a.db", txns, budgets)
+    b = _seed(tmp_path / "b.db", txns[:2], [])
+    return a, b, tmp_path
+
+
+def test_month_range_rolls_over_year():
+    assert month_range("2025-11", "2026-02") == ["2025-11", "2025-12", "2026-01", "2026-02"]
+    with pytest.raises(ValueError):
+        month_range("2026-02", "2026-01")
+
+
+def test_batch_report_combines_databases_and_isolates_failures(user_dbs):
+    a, b, tmp_path = user_dbs
+    missing = f"sqlite:///{tmp_path / 'missing.db'}"
+
+    reports = batch_report([a, b, missing, "notaurl"], ["2025-12", "2026-01"], workers=2)
+
+    ok = {(r["database"], r["month"]): r for r in reports if "error" not in r}
+    errors = [r for r in reports if "error" in r]
+    assert set(ok) == {(str(tmp_path / db), m)
+                       for db in ("a.db", "b.db") for m in ("2025-12", "2026-01")}
+    assert [r["database"] for r in errors] == [str(tmp_path / "missing.db"), "notaurl"]
+    assert not (tmp_path / "missing.db").exists()
+
+    dec = ok[(str(tmp_path / "a.db"), "2025-12")]
+    assert (dec["total_spend"], dec["txns"], dec["total_budget"]) == (100.0, 2, 80.0)
+    assert dec["categories"] == [
+        {"category": "Food", "budget": 80.0, "actual": 100.0, "delta": 20.0, "txns": 2},
+    ]
+    assert dec["proposals"][0].startswith("Alert: Food is over budget")
+
+    jan = ok[(str(tmp_path / "a.db"), "2026-01")]
+    assert {c["category"]: c["actual"] for c in jan["categories"]} == {"Other": 25.0, "Travel": 0.0}
+    assert ok[(str(tmp_path / "b.db"), "2026-01")]["categories"] == []
+
+
+def test_write_csv_and_json(user_dbs):
+    a, _, tmp_path = user_dbs
+    reports = batch_report([a, "notaurl"], ["2025-12", "2026-01"], workers=1)
+
+    out = io.StringIO()
+    write_csv(reports, out)
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [(r["month"], r["category"], r["actual"]) for r in rows] == [
+        ("2025-12", "Food", "100.0"),
+        ("2026-01", "Other", "25.0"),
+        ("2026-01", "Travel", "0.0"),
+    ]
+
+    out = io.StringIO()
+    write_json(reports, out)
+    assert json.loads(out.getvalue()) == reports
+
+
+def test_readonly_engine_rejects_writes(user_dbs):
+    a, _, _ = user_dbs
+    engine = readonly_engine(a)
+    with pytest.raises(OperationalError), engine.begin() as conn:
+        conn.execute(text("DELETE FROM budgets"))